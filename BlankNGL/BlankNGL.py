@@ -27,8 +27,8 @@ class MainWindow(QOpenGLWindow):
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("Blank NGL")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -48,7 +48,6 @@ class MainWindow(QOpenGLWindow):
 
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         except OpenGL.error.GLError:
@@ -70,8 +69,8 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
             self.update()
 
@@ -80,8 +79,8 @@ class MainWindow(QOpenGLWindow):
 
                 diffx = int(event.x() - self.origX)
                 diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = event.x()
                 self.origY = event.y()
                 self.update()
@@ -114,13 +113,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
     ##############################################################################
@@ -168,18 +166,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
-            if numPixels.y() > 0:
-                self.modelPos.m_x += self.ZOOM
-
-            elif numPixels.y() < 0:
-                self.modelPos.m_x -= self.ZOOM
-
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
         def keyPressEvent(self, event):
@@ -191,11 +183,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key.Key_L:
-                self.transformLight ^= True
             self.update()
 
         # todo try and capture Mac gestures
@@ -222,7 +212,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
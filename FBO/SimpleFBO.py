@@ -27,8 +27,8 @@ class MainWindow(QOpenGLWindow):
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("Simple FBO Demo")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -66,6 +66,8 @@ class MainWindow(QOpenGLWindow):
         # now load to our new camera
         self.view = lookAt(From, to, up)
         self.projection = perspective(45.0, float(self.width / self.height), 0.1, 200.0)
+        # the camera is static so only recompute this when the projection changes
+        self.VP = self.projection * self.view
         ShaderLib.setUniform("camPos", From)
         # now a light
         self.lightPos.set(0.0, 2.0, 2.0, 1.0)
@@ -89,17 +91,20 @@ class MainWindow(QOpenGLWindow):
         self.createFramebufferObject()
         VAOPrimitives.createTrianglePlane("plane", 2, 2, 20, 20, Vec3(0, 1, 0))
         VAOPrimitives.createSphere("sphere", 0.4, 80)
+        # the sphere is fixed above the plane so its model matrix never changes
+        self.sphereTX = Mat4()
+        self.sphereTX.translate(0.0, 1.0, 0.0)
         self.startTimer(1)
 
     def loadMatricesToShader(self):
         ShaderLib.use("PBR")
         M = self.transform.getMatrix()
-        MVP = self.projection * self.view * M
-        normalMatrix = M
-        normalMatrix.inverse().transpose()
+        MVP = self.VP * M
         ShaderLib.setUniform("M", M)
         ShaderLib.setUniform("MVP", MVP)
-        ShaderLib.setUniform("normalMatrix", normalMatrix)
+        # the teapot is only rotated so M is rigid and the PBR shader's
+        # mat3(normalMatrix) of it is already the inverse transpose
+        ShaderLib.setUniform("normalMatrix", M)
         if self.transformLight == True:
             ShaderLib.setUniform(
                 "lightPosition", (self.mouseGlobalTX * self.lightPos).toVec3()
@@ -107,7 +112,6 @@ class MainWindow(QOpenGLWindow):
 
     def paintGL(self):
         try:
-            self.makeCurrent()
             # we are now going to draw to our FBO
             # set the rendering destination to FBO
             glBindFramebuffer(GL_FRAMEBUFFER, self.fboID)
@@ -147,17 +151,11 @@ class MainWindow(QOpenGLWindow):
             ShaderLib.use("TextureShader")
             # this takes into account retina displays etc
             glViewport(0, 0, self.width, self.height)
-            self.transform.reset()
-            MVP = self.projection * self.view * self.mouseGlobalTX
+            MVP = self.VP * self.mouseGlobalTX
             ShaderLib.setUniform("MVP", MVP)
             VAOPrimitives.draw("plane")
-            self.transform.setPosition(0, 1, 0)
-            MVP = (
-                self.projection
-                * self.view
-                * self.mouseGlobalTX
-                * self.transform.getMatrix()
-            )
+            # the sphere sits on top of the plane so reuse its MVP
+            MVP = MVP * self.sphereTX
             ShaderLib.setUniform("MVP", MVP)
             VAOPrimitives.draw("sphere")
 
@@ -180,7 +178,6 @@ class MainWindow(QOpenGLWindow):
             # tx.translate(0.0,-0.45,0.0)
             # MVP=self.projection*self.view*self.mouseGlobalTX*tx
             # normalMatrix=Mat3(self.view*self.mouseGlobalTX)
-            # normalMatrix.inverse().transpose()
             # ShaderLib.setUniform('MVP',MVP)
             # ShaderLib.setUniform('normalMatrix',normalMatrix)
             # VAOPrimitives.draw('floor')
@@ -192,6 +189,7 @@ class MainWindow(QOpenGLWindow):
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.projection = perspective(45.0, float(self.width) / self.height, 0.1, 200.0)
+        self.VP = self.projection * self.view
 
     def createTextureObject(self):
         # create a texture object
@@ -261,8 +259,8 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
             elif key == Qt.Key_L:
                 self.transformLight ^= True
@@ -273,8 +271,8 @@ class MainWindow(QOpenGLWindow):
 
                 diffx = int(event.x() - self.origX)
                 diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = event.x()
                 self.origY = event.y()
                 self.update()
@@ -307,13 +305,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
     ##############################################################################
@@ -361,18 +358,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
-            if numPixels.y() > 0:
-                self.modelPos.m_x += self.ZOOM
-
-            elif numPixels.y() < 0:
-                self.modelPos.m_x -= self.ZOOM
-
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
         def keyPressEvent(self, event):
@@ -384,8 +375,8 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
             elif key == Qt.Key.Key_L:
                 self.transformLight ^= True
@@ -415,7 +406,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
@@ -28,24 +28,18 @@ class MainWindow(QOpenGLWindow):
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("pyNGL demo")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
 
     def wheelEvent(self, event):
-        numPixels = event.pixelDelta()
-        if numPixels.x() > 0:
-            self.modelPos.m_z += self.ZOOM
-
-        elif numPixels.x() < 0:
-            self.modelPos.m_z -= self.ZOOM
-        if numPixels.y() > 0:
-            self.modelPos.m_x += self.ZOOM
-
-        elif numPixels.y() < 0:
-            self.modelPos.m_x -= self.ZOOM
-
+        angle = event.angleDelta()
+        delta = angle.y() or angle.x()
+        # nothing to zoom so don't trigger a repaint
+        if delta == 0:
+            return
+        self.modelPos.m_z += self.ZOOM * delta / 120.0
         self.update()
 
     def keyPressEvent(self, event):
@@ -57,8 +51,8 @@ class MainWindow(QOpenGLWindow):
         elif key == Qt.Key.Key_S:
             glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
         elif key == Qt.Key.Key_Space:
-            self.spinXFace = 0
-            self.spinYFace = 0
+            self.spinXFace = 0.0
+            self.spinYFace = 0.0
             self.modelPos.set(Vec3.zero())
         elif key == Qt.Key.Key_B:
             self.showBBox ^= True
@@ -115,7 +109,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow(oname, tname)
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
@@ -55,6 +55,8 @@ class NGLScene(QOpenGLWidget):
         # now load to our new camera
         self.view = lookAt(From, to, up)
         self.projection = perspective(45.0, float(self.width / self.height), 0.1, 200.0)
+        # the camera is static so only recompute this when the projection changes
+        self.VP = self.projection * self.view
         ShaderLib.setUniform("camPos", From)
         # now a light
         self.lightPos.set(0.0, 2.0, 2.0, 1.0)
@@ -71,18 +73,16 @@ class NGLScene(QOpenGLWidget):
         VAOPrimitives.createSphere("sphere", 1.0, 40)
 
     def loadMatricesToShader(self):
-        ShaderLib.use("PBR")
         M = self.transform.getMatrix()
-        MVP = self.projection * self.view * M
-        normalMatrix = M
-        normalMatrix.inverse().transpose()
+        MVP = self.VP * M
+        normalMatrix = M.inverse()
+        normalMatrix.transpose()
         ShaderLib.setUniform("M", M)
         ShaderLib.setUniform("MVP", MVP)
         ShaderLib.setUniform("normalMatrix", normalMatrix)
 
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             ShaderLib.use("PBR")
@@ -105,6 +105,7 @@ class NGLScene(QOpenGLWidget):
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.projection = perspective(45.0, float(self.width) / self.height, 0.1, 200.0)
+        self.VP = self.projection * self.view
 
     def toggleWireframe(self):
         self.wireframe ^= True
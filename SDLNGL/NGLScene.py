@@ -6,10 +6,16 @@ from pyngl import *
 class NGLScene:
     def __init__(self):
         self.mouseGlobalTX = Mat4()
+        self.mouseState = None
+        self.rotationState = None
+        # scratch matrices for the mouse rotation, rotateX/Y overwrite the
+        # rotation terms each time so these can be reused every frame
+        self.rotX = Mat4()
+        self.rotY = Mat4()
         self.width = int(1024)
         self.height = int(720)
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -56,6 +62,9 @@ class NGLScene:
         ShaderLib.setUniform("roughness", 0.38)
         ShaderLib.setUniform("ao", 0.2)
         VAOPrimitives.createTrianglePlane("floor", 20, 20, 1, 1, Vec3.up())
+        # the floor never moves relative to the teapot so build its transform once
+        self.floorTX = Mat4()
+        self.floorTX.translate(0.0, -0.45, 0.0)
         ShaderLib.printRegisteredUniforms("PBR")
         ShaderLib.use(nglCheckerShader)
         ShaderLib.setUniform("lightDiffuse", 1.0, 1.0, 1.0, 1.0)
@@ -67,14 +76,11 @@ class NGLScene:
         ShaderLib.printRegisteredUniforms(nglCheckerShader)
 
     def loadMatricesToShader(self):
-        ShaderLib.use("PBR")
-        M = self.view * self.mouseGlobalTX
-        MVP = self.projection * M
-        normalMatrix = M
-        normalMatrix.inverse().transpose()
-        ShaderLib.setUniform("M", M)
-        ShaderLib.setUniform("MVP", MVP)
-        ShaderLib.setUniform("normalMatrix", normalMatrix)
+        ShaderLib.setUniform("M", self.MV)
+        ShaderLib.setUniform("MVP", self.MVP)
+        # the PBR shader only uses mat3(normalMatrix) and MV is rigid, so MV
+        # itself will do
+        ShaderLib.setUniform("normalMatrix", self.MV)
         if self.transformLight == True:
             ShaderLib.setUniform(
                 "lightPosition", (self.mouseGlobalTX * self.lightPos).toVec3()
@@ -85,25 +91,39 @@ class NGLScene:
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             ShaderLib.use("PBR")
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
-            self.mouseGlobalTX.m_30 = self.modelPos.m_x
-            self.mouseGlobalTX.m_31 = self.modelPos.m_y
-            self.mouseGlobalTX.m_32 = self.modelPos.m_z
+            # only rebuild the mouse transform when the user has moved the scene
+            mouseState = (
+                self.spinXFace,
+                self.spinYFace,
+                self.modelPos.m_x,
+                self.modelPos.m_y,
+                self.modelPos.m_z,
+            )
+            if mouseState != self.mouseState:
+                self.rotX.rotateX(self.spinXFace)
+                self.rotY.rotateY(self.spinYFace)
+                self.mouseGlobalTX = self.rotY * self.rotX
+                self.mouseGlobalTX.m_30 = self.modelPos.m_x
+                self.mouseGlobalTX.m_31 = self.modelPos.m_y
+                self.mouseGlobalTX.m_32 = self.modelPos.m_z
+                # both draws share the camera and mouse transform so only build it once
+                self.MV = self.view * self.mouseGlobalTX
+                self.MVP = self.projection * self.MV
+                self.mouseState = mouseState
+                # MV is only rotation and translation so its upper 3x3 is already
+                # the inverse transpose, panning doesn't change it so only
+                # rebuild the normal matrix on rotation
+                rotationState = (self.spinXFace, self.spinYFace)
+                if rotationState != self.rotationState:
+                    self.normalMatrix = Mat3(self.MV)
+                    self.rotationState = rotationState
             self.loadMatricesToShader()
             VAOPrimitives.draw("teapot")
 
             ShaderLib.use(nglCheckerShader)
-            tx = Mat4()
-            tx.translate(0.0, -0.45, 0.0)
-            MVP = self.projection * self.view * self.mouseGlobalTX * tx
-            normalMatrix = Mat3(self.view * self.mouseGlobalTX)
-            normalMatrix.inverse().transpose()
+            MVP = self.MVP * self.floorTX
             ShaderLib.setUniform("MVP", MVP)
-            ShaderLib.setUniform("normalMatrix", normalMatrix)
+            ShaderLib.setUniform("normalMatrix", self.normalMatrix)
             VAOPrimitives.draw("floor")
 
         except OpenGL.error.GLError:
@@ -113,6 +133,8 @@ class NGLScene:
         self.width = int(w)
         self.height = int(h)
         self.projection = perspective(45.0, float(self.width) / self.height, 0.1, 200.0)
+        # MVP depends on the projection so force a rebuild on the next frame
+        self.mouseState = None
 
     def mousePressEvent(self, event):
         if event.button == sdl2.SDL_BUTTON_LEFT:
@@ -138,8 +160,8 @@ class NGLScene:
         if self.rotate and event.button == sdl2.SDL_BUTTON_LEFT:
             diffx = int(event.x - self.origX)
             diffy = int(event.y - self.origY)
-            self.spinXFace += int(0.5 * diffy)
-            self.spinYFace += int(0.5 * diffx)
+            self.spinXFace += 0.5 * diffy
+            self.spinYFace += 0.5 * diffx
             self.origX = event.x
             self.origY = event.y
         elif self.translate and event.button == sdl2.SDL_BUTTON_RIGHT:
@@ -24,11 +24,17 @@ class MainWindow(QOpenGLWindow):
     def __init__(self, parent=None):
         super(QOpenGLWindow, self).__init__(parent)
         self.mouseGlobalTX = Mat4()
+        self.mouseState = None
+        self.rotationState = None
+        # scratch matrices for the mouse rotation, rotateX/Y overwrite the
+        # rotation terms each time so these can be reused every frame
+        self.rotX = Mat4()
+        self.rotY = Mat4()
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("pyNGL demo")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -40,6 +46,7 @@ class MainWindow(QOpenGLWindow):
         self.modelPos = Vec3()
         self.lightPos = Vec4()
         self.transformLight = False
+        self.pendingDrag = None
 
     def initializeGL(self):
         self.makeCurrent()
@@ -76,6 +83,9 @@ class MainWindow(QOpenGLWindow):
         ShaderLib.setUniform("roughness", 0.38)
         ShaderLib.setUniform("ao", 0.2)
         VAOPrimitives.createTrianglePlane("floor", 20, 20, 1, 1, Vec3.up())
+        # the floor never moves relative to the teapot so build its transform once
+        self.floorTX = Mat4()
+        self.floorTX.translate(0.0, -0.45, 0.0)
         ShaderLib.printRegisteredUniforms("PBR")
         ShaderLib.use(nglCheckerShader)
         ShaderLib.setUniform("lightDiffuse", 1.0, 1.0, 1.0, 1.0)
@@ -87,44 +97,77 @@ class MainWindow(QOpenGLWindow):
         ShaderLib.printRegisteredUniforms(nglCheckerShader)
 
     def loadMatricesToShader(self):
-        ShaderLib.use("PBR")
-        M = self.view * self.mouseGlobalTX
-        MVP = self.projection * M
-        normalMatrix = M
-        normalMatrix.inverse().transpose()
-        ShaderLib.setUniform("M", M)
-        ShaderLib.setUniform("MVP", MVP)
-        ShaderLib.setUniform("normalMatrix", normalMatrix)
+        ShaderLib.setUniform("M", self.MV)
+        ShaderLib.setUniform("MVP", self.MVP)
+        # the PBR shader only uses mat3(normalMatrix) and MV is rigid, so MV
+        # itself will do
+        ShaderLib.setUniform("normalMatrix", self.MV)
         if self.transformLight == True:
             ShaderLib.setUniform(
                 "lightPosition", (self.mouseGlobalTX * self.lightPos).toVec3()
             )
 
+    def applyPendingDrag(self):
+        # the mouse can report moves much faster than we redraw so only the
+        # latest position is kept and applied once per frame
+        if self.pendingDrag is None:
+            return
+        x, y, rotate = self.pendingDrag
+        self.pendingDrag = None
+        if rotate:
+            diffx = int(x - self.origX)
+            diffy = int(y - self.origY)
+            self.spinXFace += 0.5 * diffy
+            self.spinYFace += 0.5 * diffx
+            self.origX = x
+            self.origY = y
+        else:
+            diffX = int(x - self.origXPos)
+            diffY = int(y - self.origYPos)
+            self.origXPos = x
+            self.origYPos = y
+            self.modelPos.m_x += self.INCREMENT * diffX
+            self.modelPos.m_y -= self.INCREMENT * diffY
+
     def paintGL(self):
         try:
-            self.makeCurrent()
+            self.applyPendingDrag()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             ShaderLib.use("PBR")
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
-            self.mouseGlobalTX.m_30 = self.modelPos.m_x
-            self.mouseGlobalTX.m_31 = self.modelPos.m_y
-            self.mouseGlobalTX.m_32 = self.modelPos.m_z
+            # only rebuild the mouse transform when the user has moved the scene
+            mouseState = (
+                self.spinXFace,
+                self.spinYFace,
+                self.modelPos.m_x,
+                self.modelPos.m_y,
+                self.modelPos.m_z,
+            )
+            if mouseState != self.mouseState:
+                self.rotX.rotateX(self.spinXFace)
+                self.rotY.rotateY(self.spinYFace)
+                self.mouseGlobalTX = self.rotY * self.rotX
+                self.mouseGlobalTX.m_30 = self.modelPos.m_x
+                self.mouseGlobalTX.m_31 = self.modelPos.m_y
+                self.mouseGlobalTX.m_32 = self.modelPos.m_z
+                # both draws share the camera and mouse transform so only build it once
+                self.MV = self.view * self.mouseGlobalTX
+                self.MVP = self.projection * self.MV
+                self.mouseState = mouseState
+                # MV is only rotation and translation so its upper 3x3 is already
+                # the inverse transpose, panning doesn't change it so only
+                # rebuild the normal matrix on rotation
+                rotationState = (self.spinXFace, self.spinYFace)
+                if rotationState != self.rotationState:
+                    self.normalMatrix = Mat3(self.MV)
+                    self.rotationState = rotationState
             self.loadMatricesToShader()
             VAOPrimitives.draw("teapot")
 
             ShaderLib.use(nglCheckerShader)
-            tx = Mat4()
-            tx.translate(0.0, -0.45, 0.0)
-            MVP = self.projection * self.view * self.mouseGlobalTX * tx
-            normalMatrix = Mat3(self.view * self.mouseGlobalTX)
-            normalMatrix.inverse().transpose()
+            MVP = self.MVP * self.floorTX
             ShaderLib.setUniform("MVP", MVP)
-            ShaderLib.setUniform("normalMatrix", normalMatrix)
+            ShaderLib.setUniform("normalMatrix", self.normalMatrix)
             VAOPrimitives.draw("floor")
 
         except OpenGL.error.GLError:
@@ -134,6 +177,8 @@ class MainWindow(QOpenGLWindow):
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.projection = perspective(45.0, float(self.width) / self.height, 0.1, 200.0)
+        # MVP depends on the projection so force a rebuild on the next frame
+        self.mouseState = None
 
     if PyQtVersion == 5:
 
@@ -146,34 +191,25 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
+                self.pendingDrag = None
             elif key == Qt.Key_L:
                 self.transformLight ^= True
             self.update()
 
         def mouseMoveEvent(self, event):
             if self.rotate and event.buttons() == Qt.LeftButton:
-
-                diffx = int(event.x() - self.origX)
-                diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
-                self.origX = event.x()
-                self.origY = event.y()
+                self.pendingDrag = (event.x(), event.y(), True)
                 self.update()
             elif self.translate and event.buttons() == Qt.RightButton:
-
-                diffX = int(event.x() - self.origXPos)
-                diffY = int(event.y() - self.origYPos)
-                self.origXPos = event.x()
-                self.origYPos = event.y()
-                self.modelPos.m_x += self.INCREMENT * diffX
-                self.modelPos.m_y -= self.INCREMENT * diffY
+                self.pendingDrag = (event.x(), event.y(), False)
                 self.update()
 
         def mousePressEvent(self, event):
+            # a drag queued against the old origin must not be applied
+            self.pendingDrag = None
             if event.button() == Qt.LeftButton:
                 self.origX = event.x()
                 self.origY = event.y()
@@ -185,6 +221,8 @@ class MainWindow(QOpenGLWindow):
                 self.translate = True
 
         def mouseReleaseEvent(self, event):
+            # keep the last move of the drag before the mode is turned off
+            self.applyPendingDrag()
             if event.button() == Qt.LeftButton:
                 self.rotate = False
 
@@ -192,13 +230,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
     ##############################################################################
@@ -207,6 +244,8 @@ class MainWindow(QOpenGLWindow):
     else:  # Qt6 Versions
 
         def mousePressEvent(self, event):
+            # a drag queued against the old origin must not be applied
+            self.pendingDrag = None
             pos = event.position()
             if event.button() == Qt.MouseButton.LeftButton:
                 self.origX = pos.x()
@@ -221,24 +260,16 @@ class MainWindow(QOpenGLWindow):
         def mouseMoveEvent(self, event):
             if self.rotate and event.buttons() == Qt.MouseButton.LeftButton:
                 pos = event.position()
-                diffx = int(pos.x() - self.origX)
-                diffy = int(pos.y() - self.origY)
-                self.spinXFace += 0.5 * diffy
-                self.spinYFace += 0.5 * diffx
-                self.origX = pos.x()
-                self.origY = pos.y()
+                self.pendingDrag = (pos.x(), pos.y(), True)
                 self.update()
             elif self.translate and event.buttons() == Qt.MouseButton.RightButton:
                 pos = event.position()
-                diffX = int(pos.x() - self.origXPos)
-                diffY = int(pos.y() - self.origYPos)
-                self.origXPos = pos.x()
-                self.origYPos = pos.y()
-                self.modelPos.m_x += self.INCREMENT * diffX
-                self.modelPos.m_y -= self.INCREMENT * diffY
+                self.pendingDrag = (pos.x(), pos.y(), False)
                 self.update()
 
         def mouseReleaseEvent(self, event):
+            # keep the last move of the drag before the mode is turned off
+            self.applyPendingDrag()
             if event.button() == Qt.MouseButton.LeftButton:
                 self.rotate = False
 
@@ -246,18 +277,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
-            if numPixels.y() > 0:
-                self.modelPos.m_x += self.ZOOM
-
-            elif numPixels.y() < 0:
-                self.modelPos.m_x -= self.ZOOM
-
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
         def keyPressEvent(self, event):
@@ -269,9 +294,10 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
+                self.pendingDrag = None
             elif key == Qt.Key.Key_L:
                 self.transformLight ^= True
             self.update()
@@ -296,11 +322,13 @@ if __name__ == "__main__":
 
     # now set the depth buffer to 24 bits
     format.setDepthBufferSize(24)
+    # sync to the display so paintGL isn't run flat out, pass --no-vsync to
+    # measure the raw frame cost instead
+    format.setSwapInterval(0 if "--no-vsync" in sys.argv else 1)
     # set that as the default format for all windows
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
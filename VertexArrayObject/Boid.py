@@ -16,6 +16,7 @@ except ImportError:
 
 import sys
 
+import numpy as np
 from OpenGL.GL import *
 from pyngl import *
 
@@ -27,8 +28,8 @@ class MainWindow(QOpenGLWindow):
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("Boid")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -41,6 +42,27 @@ class MainWindow(QOpenGLWindow):
         self.view = Mat4()
         self.project = Mat4()
         self.vao = None
+        self.matrixDirty = True
+        self.lastSize = None
+        # scratch matrices for the mouse rotation, rotateX/Y overwrite the
+        # rotation terms each time so these can be reused every frame
+        self.rotX = Mat4()
+        self.rotY = Mat4()
+        # key bindings are looked up rather than tested in turn
+        if PyQtVersion == 5:
+            self.keyActions = {
+                Qt.Key_Escape: exit,
+                Qt.Key_W: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_LINE),
+                Qt.Key_S: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_FILL),
+                Qt.Key_Space: self.resetView,
+            }
+        else:
+            self.keyActions = {
+                Qt.Key.Key_Escape: exit,
+                Qt.Key.Key_W: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_LINE),
+                Qt.Key.Key_S: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_FILL),
+                Qt.Key.Key_Space: self.resetView,
+            }
 
     def initializeGL(self):
         self.makeCurrent()
@@ -51,210 +73,62 @@ class MainWindow(QOpenGLWindow):
 
         self.view = lookAt(Vec3(0, 1, 4), Vec3.zero(), Vec3.up())
         self.project = perspective(45.0, 720.0 / 576.0, 0.05, 350.0)
+        self.VP = self.project * self.view
         ShaderLib.use("nglColourShader")
+        # the colour never changes and uniforms keep their value, so set it once
         ShaderLib.setUniform("Colour", 1.0, 1.0, 1.0, 1.0)
         self.buildVAO()
 
     def buildVAO(self):
-        verts = VectorVec3()
-        verts.push_back(Vec3(0.0, 1.0, 1.0))
-        verts.push_back(Vec3(0.0, 0.0, -1.0))
-        verts.push_back(Vec3(-0.5, 0.0, 1.0))
-        verts.push_back(Vec3(0.0, 1.0, 1.0))
-        verts.push_back(Vec3(0.0, 0.0, -1.0))
-        verts.push_back(Vec3(0.5, 0.0, 1.0))
-        verts.push_back(Vec3(0.0, 1.0, 1.0))
-        verts.push_back(Vec3(0.0, 0.0, 1.5))
-        verts.push_back(Vec3(-0.5, 0.0, 1.0))
-        verts.push_back(Vec3(0.0, 1.0, 1.0))
-        verts.push_back(Vec3(0.0, 0.0, 1.5))
-        verts.push_back(Vec3(0.5, 0.0, 1.0))
-
-        print("creating VAO")
-        self.vao = VAOFactory.createVAO(simpleVAO, GL_TRIANGLES)
-        self.vao.bind()
-        print("VAO Bind")
-        print(len(verts) * Vec3.sizeof())
-        self.vao.setData(VertexData(len(verts) * Vec3.sizeof(), verts))
-        print("VAO Set Data")
-        self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
-        print("VAO Set Pointer")
-
-        self.vao.setNumIndices(len(verts))
-        print("VAO set induces", len(verts))
-        self.vao.unbind()
-
-    def loadMatricesToShader(self):
-        ShaderLib.setUniform("MVP", self.project * self.view * self.mouseGlobalTX)
-
-    def paintGL(self):
-        try:
-            self.makeCurrent()
-            glViewport(0, 0, self.width, self.height)
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            ShaderLib.use("nglColourShader")
-            ShaderLib.setUniform("Colour", 1.0, 1.0, 1.0, 1.0)
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
-            self.mouseGlobalTX.m_30 = self.modelPos.m_x
-            self.mouseGlobalTX.m_31 = self.modelPos.m_y
-            self.mouseGlobalTX.m_32 = self.modelPos.m_z
-            self.loadMatricesToShader()
-            self.vao.bind()
-            self.vao.draw()
-            self.vao.unbind()
-        except OpenGL.error.GLError:
-            print("error")
-
-    def resizeGL(self, w, h):
-        self.width = int(w * self.devicePixelRatio())
-        self.height = int(h * self.devicePixelRatio())
-        self.project = perspective(45.0, float(w) / h, 0.05, 350.0)
-
-    if PyQtVersion == 5:
-
-        def keyPressEvent(self, event):
-            key = event.key()
-            if key == Qt.Key_Escape:
-                exit()
-            elif key == Qt.Key_W:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            elif key == Qt.Key_S:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-            elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
-                self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key_L:
-                self.transformLight ^= True
-            self.update()
-
-        def mouseMoveEvent(self, event):
-            if self.rotate and event.buttons() == Qt.LeftButton:
-
-                diffx = int(event.x() - self.origX)
-                diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
-                self.origX = event.x()
-                self.origY = event.y()
-                self.update()
-            elif self.translate and event.buttons() == Qt.RightButton:
-
-                diffX = int(event.x() - self.origXPos)
-                diffY = int(event.y() - self.origYPos)
-                self.origXPos = event.x()
-                self.origYPos = event.y()
-                self.modelPos.m_x += self.INCREMENT * diffX
-                self.modelPos.m_y -= self.INCREMENT * diffY
-                self.update()
-
-        def mousePressEvent(self, event):
-            if event.button() == Qt.LeftButton:
-                self.origX = event.x()
-                self.origY = event.y()
-                self.rotate = True
-
-            elif event.button() == Qt.RightButton:
-                self.origXPos = event.x()
-                self.origYPos = event.y()
-                self.translate = True
-
-        def mouseReleaseEvent(self, event):
-            if event.button() == Qt.LeftButton:
-                self.rotate = False
-
-
-class MainWindow(QOpenGLWindow):
-    def __init__(self, parent=None):
-        super(QOpenGLWindow, self).__init__(parent)
-        self.mouseGlobalTX = Mat4()
-        self.width = int(1024)
-        self.height = int(720)
-        self.setTitle("Boid")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
-        self.rotate = False
-        self.translate = False
-        self.origX = int(0)
-        self.origY = int(0)
-        self.origXPos = int(0)
-        self.origYPos = int(0)
-        self.INCREMENT = 0.01
-        self.ZOOM = 0.1
-        self.modelPos = Vec3()
-        self.view = Mat4()
-        self.project = Mat4()
-        self.vao = None
-
-    def initializeGL(self):
-        self.makeCurrent()
-        NGLInit.initialize()
-        glClearColor(0.4, 0.4, 0.4, 1.0)
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_MULTISAMPLE)
-
-        self.view = lookAt(Vec3(0, 1, 4), Vec3.zero(), Vec3.up())
-        self.project = perspective(45.0, 720.0 / 576.0, 0.05, 350.0)
-        ShaderLib.use("nglColourShader")
-        ShaderLib.setUniform("Colour", 1.0, 1.0, 1.0, 1.0)
-        self.buildVAO()
-
-    def buildVAO(self):
-        verts = VectorVec3(
+        verts = np.array(
             [
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, -1.0),
-                Vec3(-0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, -1.0),
-                Vec3(0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, 1.5),
-                Vec3(-0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, 1.5),
-                Vec3(0.5, 0.0, 1.0),
-            ]
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, -1.0],
+                [-0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, -1.0],
+                [0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, 1.5],
+                [-0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, 1.5],
+                [0.5, 0.0, 1.0],
+            ],
+            dtype=np.float32,
         )
 
-        print("creating VAO")
         self.vao = VAOFactory.createVAO(simpleVAO, GL_TRIANGLES)
         self.vao.bind()
-        print("VAO Bind")
-        print(len(verts) * Vec3.sizeof())
-        self.vao.setData(len(verts) * Vec3.sizeof(), verts)
-        print("VAO Set Data")
+        # let the vao create its buffer, it is left bound so fill it from the
+        # array directly
+        self.vao.setData(0, VectorVec3())
+        glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
         self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
-        print("VAO Set Pointer")
 
         self.vao.setNumIndices(len(verts))
-        print("VAO set induces", len(verts))
 
         self.vao.unbind()
 
     def loadMatricesToShader(self):
-        ShaderLib.setUniform("MVP", self.project * self.view * self.mouseGlobalTX)
+        ShaderLib.setUniform("MVP", self.VP * self.mouseGlobalTX)
 
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             ShaderLib.use("nglColourShader")
-            ShaderLib.setUniform("Colour", 1.0, 1.0, 1.0, 1.0)
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
-            self.mouseGlobalTX.m_30 = self.modelPos.m_x
-            self.mouseGlobalTX.m_31 = self.modelPos.m_y
-            self.mouseGlobalTX.m_32 = self.modelPos.m_z
-            self.loadMatricesToShader()
+            # uniforms keep their value so only rebuild and upload the matrices
+            # when the mouse or a resize has changed them
+            if self.matrixDirty:
+                self.rotX.rotateX(self.spinXFace)
+                self.rotY.rotateY(self.spinYFace)
+                self.mouseGlobalTX = self.rotY * self.rotX
+                self.mouseGlobalTX.m_30 = self.modelPos.m_x
+                self.mouseGlobalTX.m_31 = self.modelPos.m_y
+                self.mouseGlobalTX.m_32 = self.modelPos.m_z
+                self.loadMatricesToShader()
+                self.matrixDirty = False
             self.vao.bind()
             self.vao.draw()
             self.vao.unbind()
@@ -262,47 +136,56 @@ class MainWindow(QOpenGLWindow):
             print("error")
 
     def resizeGL(self, w, h):
+        # Qt can resend the same size, so skip rebuilding the projection
+        size = (w, h, self.devicePixelRatio())
+        if size == self.lastSize:
+            return
+        self.lastSize = size
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.project = perspective(45.0, float(w) / h, 0.05, 350.0)
+        self.VP = self.project * self.view
+        self.matrixDirty = True
+
+    def resetView(self):
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
+        self.modelPos.set(Vec3.zero())
+
+    def rotateBy(self, x, y):
+        diffx = int(x - self.origX)
+        diffy = int(y - self.origY)
+        self.spinXFace += 0.5 * diffy
+        self.spinYFace += 0.5 * diffx
+        self.origX = x
+        self.origY = y
+        self.matrixDirty = True
+        self.update()
+
+    def translateBy(self, x, y):
+        diffX = int(x - self.origXPos)
+        diffY = int(y - self.origYPos)
+        self.origXPos = x
+        self.origYPos = y
+        self.modelPos.m_x += self.INCREMENT * diffX
+        self.modelPos.m_y -= self.INCREMENT * diffY
+        self.matrixDirty = True
+        self.update()
+
+    def keyPressEvent(self, event):
+        action = self.keyActions.get(event.key())
+        if action is not None:
+            action()
+        self.matrixDirty = True
+        self.update()
 
     if PyQtVersion == 5:
 
-        def keyPressEvent(self, event):
-            key = event.key()
-            if key == Qt.Key_Escape:
-                exit()
-            elif key == Qt.Key_W:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            elif key == Qt.Key_S:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-            elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
-                self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key_L:
-                self.transformLight ^= True
-            self.update()
-
         def mouseMoveEvent(self, event):
             if self.rotate and event.buttons() == Qt.LeftButton:
-
-                diffx = int(event.x() - self.origX)
-                diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
-                self.origX = event.x()
-                self.origY = event.y()
-                self.update()
+                self.rotateBy(event.x(), event.y())
             elif self.translate and event.buttons() == Qt.RightButton:
-
-                diffX = int(event.x() - self.origXPos)
-                diffY = int(event.y() - self.origYPos)
-                self.origXPos = event.x()
-                self.origYPos = event.y()
-                self.modelPos.m_x += self.INCREMENT * diffX
-                self.modelPos.m_y -= self.INCREMENT * diffY
-                self.update()
+                self.translateBy(event.x(), event.y())
 
         def mousePressEvent(self, event):
             if event.button() == Qt.LeftButton:
@@ -323,13 +206,13 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
+            self.matrixDirty = True
             self.update()
 
     ##############################################################################
@@ -352,22 +235,10 @@ class MainWindow(QOpenGLWindow):
         def mouseMoveEvent(self, event):
             if self.rotate and event.buttons() == Qt.MouseButton.LeftButton:
                 pos = event.position()
-                diffx = int(pos.x() - self.origX)
-                diffy = int(pos.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
-                self.origX = pos.x()
-                self.origY = pos.y()
-                self.update()
+                self.rotateBy(pos.x(), pos.y())
             elif self.translate and event.buttons() == Qt.MouseButton.RightButton:
                 pos = event.position()
-                diffX = int(pos.x() - self.origXPos)
-                diffY = int(pos.y() - self.origYPos)
-                self.origXPos = pos.x()
-                self.origYPos = pos.y()
-                self.modelPos.m_x += self.INCREMENT * diffX
-                self.modelPos.m_y -= self.INCREMENT * diffY
-                self.update()
+                self.translateBy(pos.x(), pos.y())
 
         def mouseReleaseEvent(self, event):
             if event.button() == Qt.MouseButton.LeftButton:
@@ -377,29 +248,13 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
-            self.update()
-
-        def keyPressEvent(self, event):
-            key = event.key()
-            if key == Qt.Key.Key_Escape:
-                exit()
-            elif key == Qt.Key.Key_W:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            elif key == Qt.Key.Key_S:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-            elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
-                self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key.Key_L:
-                self.transformLight ^= True
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
+            self.matrixDirty = True
             self.update()
 
 
@@ -421,7 +276,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
@@ -16,8 +16,10 @@ except ImportError:
 
 import sys
 
+import numpy as np
 from OpenGL.GL import *
 from pyngl import *
+from TriangleNormals import triangleNormals
 
 
 class MainWindow(QOpenGLWindow):
@@ -27,8 +29,8 @@ class MainWindow(QOpenGLWindow):
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("Boid Shaded")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -41,6 +43,27 @@ class MainWindow(QOpenGLWindow):
         self.view = Mat4()
         self.project = Mat4()
         self.vao = None
+        self.matrixDirty = True
+        self.lastSize = None
+        # scratch matrices for the mouse rotation, rotateX/Y overwrite the
+        # rotation terms each time so these can be reused every frame
+        self.rotX = Mat4()
+        self.rotY = Mat4()
+        # key bindings are looked up rather than tested in turn
+        if PyQtVersion == 5:
+            self.keyActions = {
+                Qt.Key_Escape: exit,
+                Qt.Key_W: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_LINE),
+                Qt.Key_S: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_FILL),
+                Qt.Key_Space: self.resetView,
+            }
+        else:
+            self.keyActions = {
+                Qt.Key.Key_Escape: exit,
+                Qt.Key.Key_W: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_LINE),
+                Qt.Key.Key_S: lambda: glPolygonMode(GL_FRONT_AND_BACK, GL_FILL),
+                Qt.Key.Key_Space: self.resetView,
+            }
 
     def initializeGL(self):
         self.makeCurrent()
@@ -70,53 +93,57 @@ class MainWindow(QOpenGLWindow):
         self.project = perspective(
             45.0, float(self.width) / float(self.height), 0.1, 50.0
         )
+        self.VP = self.project * self.view
         self.buildVAO()
 
     def buildVAO(self):
-        verts = VectorVec3(
+        verts = np.array(
             [
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, -1.0),
-                Vec3(-0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, -1.0),
-                Vec3(0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, 1.5),
-                Vec3(-0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, 1.5),
-                Vec3(0.5, 0.0, 1.0),
-            ]
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, -1.0],
+                [-0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, -1.0],
+                [0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, 1.5],
+                [-0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, 1.5],
+                [0.5, 0.0, 1.0],
+            ],
+            dtype=np.float32,
         )
 
-        n = calcNormal(verts[2], verts[1], verts[0])
-        verts.extend([n, n, n])
-        n = calcNormal(verts[3], verts[4], verts[5])
-        verts.extend([n, n, n])
-        n = calcNormal(verts[6], verts[7], verts[8])
-        verts.extend([n, n, n])
-        n = calcNormal(verts[11], verts[10], verts[9])
-        verts.extend([n, n, n])
-        for i in range(0, len(verts)):
-            print(verts[i])
+        normals = triangleNormals(
+            verts[[2, 3, 6, 11]], verts[[1, 4, 7, 10]], verts[[0, 5, 8, 9]]
+        )
+        # interleave each position with its face normal (x,y,z,nx,ny,nz) so all
+        # of a vertex's attributes are fetched together
+        data = np.hstack((verts, np.repeat(normals, 3, axis=0)))
 
         self.vao = VAOFactory.createVAO(simpleVAO, GL_TRIANGLES)
         self.vao.bind()
-        self.vao.setData(len(verts) * Vec3.sizeof(), verts)
-        self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
-        self.vao.setVertexAttributePointer(1, 3, GL_FLOAT, 0, 12 * 3)
-
-        self.vao.setNumIndices(int(len(verts) / 2))
+        # let the vao create its buffer, it is left bound so fill it from the
+        # array directly
+        self.vao.setData(0, VectorVec3())
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        # stride is in bytes, the offset is in floats
+        stride = data.strides[0]
+        self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, stride, 0)
+        self.vao.setVertexAttributePointer(1, 3, GL_FLOAT, stride, 3)
+
+        self.vao.setNumIndices(len(verts))
         self.vao.unbind()
 
     def loadMatricesToShader(self):
         ShaderLib.use("Phong")
 
         MV = self.view * self.mouseGlobalTX
-        MVP = self.project * MV
+        MVP = self.VP * self.mouseGlobalTX
+        # MV is only rotation and translation so its upper 3x3 is already
+        # the inverse transpose, no need to compute it
         normalMatrix = Mat3(MV)
-        normalMatrix.inverse().transpose()
         ShaderLib.setUniform("MV", MV)
         ShaderLib.setUniform("MVP", MVP)
         ShaderLib.setUniform("normalMatrix", normalMatrix)
@@ -124,18 +151,19 @@ class MainWindow(QOpenGLWindow):
 
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
-            self.mouseGlobalTX.m_30 = self.modelPos.m_x
-            self.mouseGlobalTX.m_31 = self.modelPos.m_y
-            self.mouseGlobalTX.m_32 = self.modelPos.m_z
-            self.loadMatricesToShader()
+            # uniforms keep their value so only rebuild and upload the matrices
+            # when the mouse or a resize has changed them
+            if self.matrixDirty:
+                self.rotX.rotateX(self.spinXFace)
+                self.rotY.rotateY(self.spinYFace)
+                self.mouseGlobalTX = self.rotY * self.rotX
+                self.mouseGlobalTX.m_30 = self.modelPos.m_x
+                self.mouseGlobalTX.m_31 = self.modelPos.m_y
+                self.mouseGlobalTX.m_32 = self.modelPos.m_z
+                self.loadMatricesToShader()
+                self.matrixDirty = False
             self.vao.bind()
             self.vao.draw()
             self.vao.unbind()
@@ -143,47 +171,56 @@ class MainWindow(QOpenGLWindow):
             print("error")
 
     def resizeGL(self, w, h):
+        # Qt can resend the same size, so skip rebuilding the projection
+        size = (w, h, self.devicePixelRatio())
+        if size == self.lastSize:
+            return
+        self.lastSize = size
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.project = perspective(45.0, float(w) / h, 0.1, 30.0)
+        self.VP = self.project * self.view
+        self.matrixDirty = True
+
+    def resetView(self):
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
+        self.modelPos.set(Vec3.zero())
+
+    def rotateBy(self, x, y):
+        diffx = int(x - self.origX)
+        diffy = int(y - self.origY)
+        self.spinXFace += 0.5 * diffy
+        self.spinYFace += 0.5 * diffx
+        self.origX = x
+        self.origY = y
+        self.matrixDirty = True
+        self.update()
+
+    def translateBy(self, x, y):
+        diffX = int(x - self.origXPos)
+        diffY = int(y - self.origYPos)
+        self.origXPos = x
+        self.origYPos = y
+        self.modelPos.m_x += self.INCREMENT * diffX
+        self.modelPos.m_y -= self.INCREMENT * diffY
+        self.matrixDirty = True
+        self.update()
+
+    def keyPressEvent(self, event):
+        action = self.keyActions.get(event.key())
+        if action is not None:
+            action()
+        self.matrixDirty = True
+        self.update()
 
     if PyQtVersion == 5:
 
-        def keyPressEvent(self, event):
-            key = event.key()
-            if key == Qt.Key_Escape:
-                exit()
-            elif key == Qt.Key_W:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            elif key == Qt.Key_S:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-            elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
-                self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key_L:
-                self.transformLight ^= True
-            self.update()
-
         def mouseMoveEvent(self, event):
             if self.rotate and event.buttons() == Qt.LeftButton:
-
-                diffx = int(event.x() - self.origX)
-                diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
-                self.origX = event.x()
-                self.origY = event.y()
-                self.update()
+                self.rotateBy(event.x(), event.y())
             elif self.translate and event.buttons() == Qt.RightButton:
-
-                diffX = int(event.x() - self.origXPos)
-                diffY = int(event.y() - self.origYPos)
-                self.origXPos = event.x()
-                self.origYPos = event.y()
-                self.modelPos.m_x += self.INCREMENT * diffX
-                self.modelPos.m_y -= self.INCREMENT * diffY
-                self.update()
+                self.translateBy(event.x(), event.y())
 
         def mousePressEvent(self, event):
             if event.button() == Qt.LeftButton:
@@ -204,13 +241,13 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
+            self.matrixDirty = True
             self.update()
 
     ##############################################################################
@@ -233,22 +270,10 @@ class MainWindow(QOpenGLWindow):
         def mouseMoveEvent(self, event):
             if self.rotate and event.buttons() == Qt.MouseButton.LeftButton:
                 pos = event.position()
-                diffx = int(pos.x() - self.origX)
-                diffy = int(pos.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
-                self.origX = pos.x()
-                self.origY = pos.y()
-                self.update()
+                self.rotateBy(pos.x(), pos.y())
             elif self.translate and event.buttons() == Qt.MouseButton.RightButton:
                 pos = event.position()
-                diffX = int(pos.x() - self.origXPos)
-                diffY = int(pos.y() - self.origYPos)
-                self.origXPos = pos.x()
-                self.origYPos = pos.y()
-                self.modelPos.m_x += self.INCREMENT * diffX
-                self.modelPos.m_y -= self.INCREMENT * diffY
-                self.update()
+                self.translateBy(pos.x(), pos.y())
 
         def mouseReleaseEvent(self, event):
             if event.button() == Qt.MouseButton.LeftButton:
@@ -258,29 +283,13 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
-            self.update()
-
-        def keyPressEvent(self, event):
-            key = event.key()
-            if key == Qt.Key.Key_Escape:
-                exit()
-            elif key == Qt.Key.Key_W:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            elif key == Qt.Key.Key_S:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-            elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
-                self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key.Key_L:
-                self.transformLight ^= True
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
+            self.matrixDirty = True
             self.update()
 
 
@@ -302,7 +311,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
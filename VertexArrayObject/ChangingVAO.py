@@ -14,8 +14,10 @@ except ImportError:
 
     PyQtVersion = 6
 
+import ctypes
 import sys
 
+import numpy as np
 from OpenGL.GL import *
 from pyngl import *
 
@@ -24,11 +26,14 @@ class MainWindow(QOpenGLWindow):
     def __init__(self, parent=None):
         super(QOpenGLWindow, self).__init__(parent)
         self.mouseGlobalTX = Mat4()
+        # rotateX/Y only write the rotation terms so these can be reused
+        self.rotX = Mat4()
+        self.rotY = Mat4()
         self.width = 1024
         self.height = 720
         self.setTitle("Changing VAO")
-        self.spinXFace = 0
-        self.spinYFace = 0
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = 0
@@ -38,9 +43,21 @@ class MainWindow(QOpenGLWindow):
         self.INCREMENT = 0.01
         self.ZOOM = 0.1
         self.modelPos = Vec3()
-        self.lines = VectorVec3()
+        # SFC64 is the fastest of numpy's bit generators and plenty for visuals
+        self.rng = np.random.Generator(np.random.SFC64())
+        # room for the largest set of lines timerEvent can generate, each
+        # update just uses a view of the front of it
+        self.points = np.empty((12100 * 2, 3), dtype=np.float32)
+        self.lines = self.points[:0]
+        # only upload when timerEvent has generated new points
+        self.dirty = False
+        # the vertex buffer is a ring of segments each big enough for all the
+        # points, a fence per segment tells us when the gpu is done with it
+        self.fences = [None, None, None]
+        self.segment = 0
         self.view = Mat4()
         self.project = Mat4()
+        self.VP = Mat4()
 
     def initializeGL(self):
         self.makeCurrent()
@@ -53,38 +70,92 @@ class MainWindow(QOpenGLWindow):
 
         self.view = lookAt(Vec3(0, 1, 22), Vec3.zero(), Vec3.up())
         self.project = perspective(45.0, 720.0 / 576.0, 0.05, 350.0)
+        self.VP = self.project * self.view
         self.vao = VAOFactory.createVAO("simpleVAO", GL_LINES)
+        # create the buffer once and keep its id so the numpy data can be
+        # uploaded straight into it
+        self.vao.bind()
+        self.vao.setData(0, VectorVec3())
+        self.vboID = int(glGetIntegerv(GL_ARRAY_BUFFER_BINDING))
+        self.orphanBuffer()
+        # the buffer is never regenerated so the layout only needs setting once
+        self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
+        self.vao.unbind()
         self.text = Text("../fonts/Arial.ttf", 18)
         self.text.setScreenSize(self.width, self.height)
+        # the colour is a uniform on the text shader so it only needs setting once
+        self.text.setColour(1, 1, 1)
 
         self.startTimer(0)
 
+    def orphanBuffer(self):
+        # give the buffer fresh storage for every segment and let the driver
+        # free the old one once the gpu is done with it, so no fence applies
+        glBufferData(
+            GL_ARRAY_BUFFER,
+            len(self.fences) * self.points.nbytes,
+            None,
+            GL_STREAM_DRAW,
+        )
+        for i, fence in enumerate(self.fences):
+            if fence is not None:
+                glDeleteSync(fence)
+                self.fences[i] = None
+
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             ShaderLib.use("nglColourShader")
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
+            self.rotX.rotateX(self.spinXFace)
+            self.rotY.rotateY(self.spinYFace)
+            self.mouseGlobalTX = self.rotY * self.rotX
             self.mouseGlobalTX.m_30 = self.modelPos.m_x
             self.mouseGlobalTX.m_31 = self.modelPos.m_y
             self.mouseGlobalTX.m_32 = self.modelPos.m_z
-            MVP = self.project * self.view * self.mouseGlobalTX
+            MVP = self.VP * self.mouseGlobalTX
             ShaderLib.setUniform("MVP", MVP)
 
             self.vao.bind()
-            self.vao.setData(len(self.lines) * Vec3.sizeof(), self.lines)
-            # We must do this each time as we change the data.
-            self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
-            self.vao.setNumIndices(len(self.lines))
-            self.vao.draw()
+            if self.dirty:
+                # move on to the next segment
+                self.segment = (self.segment + 1) % len(self.fences)
+                glBindBuffer(GL_ARRAY_BUFFER, self.vboID)
+                # if the gpu is still reading this segment orphan the buffer
+                # rather than wait for it or write over it
+                fence = self.fences[self.segment]
+                if fence is not None:
+                    status = glClientWaitSync(fence, 0, 0)
+                    if status not in (GL_ALREADY_SIGNALED, GL_CONDITION_SATISFIED):
+                        self.orphanBuffer()
+                ptr = glMapBufferRange(
+                    GL_ARRAY_BUFFER,
+                    self.segment * self.points.nbytes,
+                    self.lines.nbytes,
+                    GL_MAP_WRITE_BIT
+                    | GL_MAP_INVALIDATE_RANGE_BIT
+                    | GL_MAP_UNSYNCHRONIZED_BIT,
+                )
+                if ptr:
+                    ctypes.memmove(ptr, self.lines.ctypes.data, self.lines.nbytes)
+                    glUnmapBuffer(GL_ARRAY_BUFFER)
+                else:
+                    # the map failed so copy the points in through fresh storage
+                    self.orphanBuffer()
+                    glBufferSubData(
+                        GL_ARRAY_BUFFER,
+                        self.segment * self.points.nbytes,
+                        self.lines.nbytes,
+                        ctypes.c_void_p(self.lines.ctypes.data),
+                    )
+                self.dirty = False
+            # draw from the start of the segment last written
+            glDrawArrays(GL_LINES, self.segment * len(self.points), len(self.lines))
+            if self.fences[self.segment] is not None:
+                glDeleteSync(self.fences[self.segment])
+            self.fences[self.segment] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
             self.vao.unbind()
 
-            self.text.setColour(1, 1, 1)
             text = "Data Size %d " % (len(self.lines) / 2)
             self.text.renderText(10, 700, text)
 
@@ -93,16 +164,20 @@ class MainWindow(QOpenGLWindow):
 
     def timerEvent(self, event):
         size = 100 + int(Random.randomPositiveNumber(12000))
-        # clear old list
-        self.lines.clear()
-        for i in range(0, size * 2):
-            self.lines.append(Random.getRandomVec3() * 5)
+        # generate all the points in one go rather than a vec3 at a time
+        self.lines = self.points[: size * 2]
+        # fill in place then scale from [0, 1) to [-5, 5) with no temporaries
+        self.rng.random(out=self.lines, dtype=np.float32)
+        self.lines *= 10.0
+        self.lines -= 5.0
+        self.dirty = True
         self.update()
 
     def resizeGL(self, w, h):
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.project = perspective(45.0, float(w) / h, 0.05, 350.0)
+        self.VP = self.project * self.view
 
     if PyQtVersion == 5:
 
@@ -115,11 +190,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key_L:
-                self.transformLight ^= True
             self.update()
 
         def mouseMoveEvent(self, event):
@@ -127,8 +200,8 @@ class MainWindow(QOpenGLWindow):
 
                 diffx = int(event.x() - self.origX)
                 diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = event.x()
                 self.origY = event.y()
                 self.update()
@@ -161,13 +234,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
     ##############################################################################
@@ -192,8 +264,8 @@ class MainWindow(QOpenGLWindow):
                 pos = event.position()
                 diffx = int(pos.x() - self.origX)
                 diffy = int(pos.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = pos.x()
                 self.origY = pos.y()
                 self.update()
@@ -215,13 +287,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
         def keyPressEvent(self, event):
@@ -233,11 +304,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key.Key_L:
-                self.transformLight ^= True
             self.update()
 
 
@@ -259,7 +328,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
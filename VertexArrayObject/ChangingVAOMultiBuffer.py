@@ -15,9 +15,10 @@ except ImportError:
     PyQtVersion = 6
 
 
-import random
+import ctypes
 import sys
 
+import numpy as np
 from OpenGL.GL import *
 from pyngl import *
 
@@ -26,11 +27,14 @@ class MainWindow(QOpenGLWindow):
     def __init__(self, parent=None):
         super(QOpenGLWindow, self).__init__(parent)
         self.mouseGlobalTX = Mat4()
+        # rotateX/Y only write the rotation terms so these can be reused
+        self.rotX = Mat4()
+        self.rotY = Mat4()
         self.width = 1024
         self.height = 720
         self.setTitle("Changing VAO")
-        self.spinXFace = 0
-        self.spinYFace = 0
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = 0
@@ -40,9 +44,22 @@ class MainWindow(QOpenGLWindow):
         self.INCREMENT = 0.01
         self.ZOOM = 0.1
         self.modelPos = Vec3()
-        self.lines = VectorVec3()
+        # SFC64 is the fastest of numpy's bit generators and plenty for visuals
+        self.rng = np.random.Generator(np.random.SFC64())
+        # room for the largest set of lines timerEvent can generate, each
+        # update just uses a view of the front of it
+        self.points = np.empty((12100 * 2, 3), dtype=np.float32)
+        self.lines = self.points[:0]
+        # only upload when timerEvent has generated new points
+        self.dirty = False
+        # the point buffer has two halves, each upload writes the half the gpu
+        # didn't draw from last time, a fence per half tells us when the gpu
+        # is done with it
+        self.half = 0
+        self.fences = [None, None]
         self.view = Mat4()
         self.project = Mat4()
+        self.VP = Mat4()
 
     def initializeGL(self):
         self.makeCurrent()
@@ -59,53 +76,84 @@ class MainWindow(QOpenGLWindow):
 
         self.view = lookAt(Vec3(0, 1, 22), Vec3.zero(), Vec3.up())
         self.project = perspective(45.0, 720.0 / 576.0, 0.05, 350.0)
+        self.VP = self.project * self.view
         self.vao = VAOFactory.createVAO("multiBufferVAO", GL_LINES)
         self.vao.bind()
         self.vao.setData(0, VectorVec3())
+        # keep the id of the point buffer so the numpy data can be uploaded
+        # straight into it
+        self.vboID = int(glGetIntegerv(GL_ARRAY_BUFFER_BINDING))
+        self.orphanBuffer()
         self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
-        # max buffer size is 12100 so create an array for the colours using this will use float buffer for simplicity
-        colours = VectorFloat()
-        for i in range(0, 15000):
-            colours.append(random.uniform(0.2, 1.0))  # r
-            colours.append(random.uniform(0.2, 1.0))  # g
-            colours.append(random.uniform(0.2, 1.0))  # b
-
-        self.vao.setData(len(colours) * sys.getsizeof(float), colours)
-        # We must do this each time as we change the data.
+        # one colour per vertex of both halves of the point buffer
+        colours = self.rng.uniform(0.2, 1.0, (2 * len(self.points), 3)).astype(
+            np.float32
+        )
+        # let the vao create the colour buffer then fill it from the array directly
+        self.vao.setData(0, VectorVec3())
+        glBufferData(GL_ARRAY_BUFFER, colours.nbytes, colours, GL_STATIC_DRAW)
         self.vao.setVertexAttributePointer(1, 3, GL_FLOAT, 0, 0)
         self.vao.unbind()
         self.text = Text("../fonts/Arial.ttf", 18)
         self.text.setScreenSize(self.width, self.height)
+        # the colour is a uniform on the text shader so it only needs setting once
+        self.text.setColour(1, 1, 1)
 
         self.startTimer(0)
 
+    def orphanBuffer(self):
+        # give the buffer fresh storage for both halves and let the driver free
+        # the old one once the gpu is done with it, so no fence applies
+        glBufferData(
+            GL_ARRAY_BUFFER, len(self.fences) * self.points.nbytes, None, GL_STREAM_DRAW
+        )
+        for i, fence in enumerate(self.fences):
+            if fence is not None:
+                glDeleteSync(fence)
+                self.fences[i] = None
+
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             ShaderLib.use("Colour")
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
+            self.rotX.rotateX(self.spinXFace)
+            self.rotY.rotateY(self.spinYFace)
+            self.mouseGlobalTX = self.rotY * self.rotX
             self.mouseGlobalTX.m_30 = self.modelPos.m_x
             self.mouseGlobalTX.m_31 = self.modelPos.m_y
             self.mouseGlobalTX.m_32 = self.modelPos.m_z
-            MVP = self.project * self.view * self.mouseGlobalTX
+            MVP = self.VP * self.mouseGlobalTX
             ShaderLib.setUniform("MVP", MVP)
 
             self.vao.bind()
-            self.vao.setData(0, len(self.lines) * Vec3.sizeof(), self.lines)
-            # We must do this each time as we change the data.
-            self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
-
-            self.vao.setNumIndices(len(self.lines))
-            self.vao.draw()
+            if self.dirty:
+                # write the half that wasn't drawn from last time
+                self.half ^= 1
+                glBindBuffer(GL_ARRAY_BUFFER, self.vboID)
+                # if the gpu is still reading this half orphan the buffer so the
+                # write doesn't have to wait for it
+                fence = self.fences[self.half]
+                if fence is not None:
+                    status = glClientWaitSync(fence, 0, 0)
+                    if status not in (GL_ALREADY_SIGNALED, GL_CONDITION_SATISFIED):
+                        self.orphanBuffer()
+                # lines is already contiguous float32 so pass the pointer
+                # directly rather than letting PyOpenGL convert the array
+                glBufferSubData(
+                    GL_ARRAY_BUFFER,
+                    self.half * self.points.nbytes,
+                    self.lines.nbytes,
+                    ctypes.c_void_p(self.lines.ctypes.data),
+                )
+                self.dirty = False
+            # draw from the start of the half last written
+            glDrawArrays(GL_LINES, self.half * len(self.points), len(self.lines))
+            if self.fences[self.half] is not None:
+                glDeleteSync(self.fences[self.half])
+            self.fences[self.half] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
             self.vao.unbind()
 
-            self.text.setColour(1, 1, 1)
             text = "Data Size %d " % (len(self.lines) / 2)
             self.text.renderText(10, 700, text)
 
@@ -114,16 +162,20 @@ class MainWindow(QOpenGLWindow):
 
     def timerEvent(self, event):
         size = 100 + int(Random.randomPositiveNumber(12000))
-        # clear old list
-        self.lines.clear()
-        for i in range(0, size * 2):
-            self.lines.append(Random.getRandomVec3() * 5)
+        # generate all the points in one go rather than a vec3 at a time
+        self.lines = self.points[: size * 2]
+        # fill in place then scale from [0, 1) to [-5, 5) with no temporaries
+        self.rng.random(out=self.lines, dtype=np.float32)
+        self.lines *= 10.0
+        self.lines -= 5.0
+        self.dirty = True
         self.update()
 
     def resizeGL(self, w, h):
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.project = perspective(45.0, float(w) / h, 0.05, 350.0)
+        self.VP = self.project * self.view
 
     if PyQtVersion == 5:
 
@@ -136,11 +188,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key_L:
-                self.transformLight ^= True
             self.update()
 
         def mouseMoveEvent(self, event):
@@ -148,8 +198,8 @@ class MainWindow(QOpenGLWindow):
 
                 diffx = int(event.x() - self.origX)
                 diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = event.x()
                 self.origY = event.y()
                 self.update()
@@ -182,13 +232,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
     ##############################################################################
@@ -213,8 +262,8 @@ class MainWindow(QOpenGLWindow):
                 pos = event.position()
                 diffx = int(pos.x() - self.origX)
                 diffy = int(pos.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = pos.x()
                 self.origY = pos.y()
                 self.update()
@@ -236,13 +285,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
         def keyPressEvent(self, event):
@@ -254,11 +302,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key.Key_L:
-                self.transformLight ^= True
             self.update()
 
 
@@ -280,7 +326,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
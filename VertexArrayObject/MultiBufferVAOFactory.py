@@ -17,19 +17,24 @@ except ImportError:
 
 import sys
 
+import numpy as np
 from OpenGL.GL import *
 from pyngl import *
+from TriangleNormals import triangleNormals
 
 
 class MainWindow(QOpenGLWindow):
     def __init__(self, parent=None):
         super(QOpenGLWindow, self).__init__(parent)
         self.mouseGlobalTX = Mat4()
+        # rotateX/Y only write the rotation terms so these can be reused
+        self.rotX = Mat4()
+        self.rotY = Mat4()
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("Boid")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -74,48 +79,53 @@ class MainWindow(QOpenGLWindow):
         self.buildVAO()
 
     def buildVAO(self):
-        verts = VectorVec3(
+        verts = np.array(
             [
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, -1.0),
-                Vec3(-0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, -1.0),
-                Vec3(0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, 1.5),
-                Vec3(-0.5, 0.0, 1.0),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(0.0, 0.0, 1.5),
-                Vec3(0.5, 0.0, 1.0),
-            ]
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, -1.0],
+                [-0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, -1.0],
+                [0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, 1.5],
+                [-0.5, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, 1.5],
+                [0.5, 0.0, 1.0],
+            ],
+            dtype=np.float32,
         )
 
-        normals = VectorVec3()
-        n = calcNormal(verts[2], verts[1], verts[0])
-        normals.extend([n, n, n])
-        n = calcNormal(verts[3], verts[4], verts[5])
-        normals.extend([n, n, n])
-        n = calcNormal(verts[6], verts[7], verts[8])
-        normals.extend([n, n, n])
-        n = calcNormal(verts[11], verts[10], verts[9])
-        normals.extend([n, n, n])
+        # one face normal per triangle repeated for each of its vertices
+        normals = np.repeat(
+            triangleNormals(
+                verts[[2, 3, 6, 11]], verts[[1, 4, 7, 10]], verts[[0, 5, 8, 9]]
+            ),
+            3,
+            axis=0,
+        )
 
         self.vao = VAOFactory.createVAO(multiBufferVAO, GL_TRIANGLES)
         self.vao.bind()
-        self.vao.setData(len(verts) * Vec3.sizeof(), verts)
+        # let the vao create each buffer, it is left bound so fill it from the
+        # array directly
+        self.vao.setData(0, VectorVec3())
+        glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
         self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 0, 0)
-        self.vao.setData(len(normals) * Vec3.sizeof(), normals)
+        self.vao.setData(0, VectorVec3())
+        glBufferData(GL_ARRAY_BUFFER, normals.nbytes, normals, GL_STATIC_DRAW)
         self.vao.setVertexAttributePointer(1, 3, GL_FLOAT, 0, 0)
         self.vao.setNumIndices(len(verts))
         self.vao.unbind()
 
     def loadMatricesToShader(self):
-        ShaderLib.use("Phong")
+        # the only shader is bound once in initializeGL
         MV = self.view * self.mouseGlobalTX
         MVP = self.project * MV
+        # MV is only rotation and translation so its upper 3x3 is already the
+        # inverse transpose
         normalMatrix = Mat3(MV)
-        normalMatrix.inverse().transpose()
         ShaderLib.setUniform("MV", MV)
         ShaderLib.setUniform("MVP", MVP)
         ShaderLib.setUniform("normalMatrix", normalMatrix)
@@ -123,14 +133,11 @@ class MainWindow(QOpenGLWindow):
 
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
+            self.rotX.rotateX(self.spinXFace)
+            self.rotY.rotateY(self.spinYFace)
+            self.mouseGlobalTX = self.rotY * self.rotX
             self.mouseGlobalTX.m_30 = self.modelPos.m_x
             self.mouseGlobalTX.m_31 = self.modelPos.m_y
             self.mouseGlobalTX.m_32 = self.modelPos.m_z
@@ -157,11 +164,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key_L:
-                self.transformLight ^= True
             self.update()
 
         def mouseMoveEvent(self, event):
@@ -169,8 +174,8 @@ class MainWindow(QOpenGLWindow):
 
                 diffx = int(event.x() - self.origX)
                 diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = event.x()
                 self.origY = event.y()
                 self.update()
@@ -203,13 +208,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
     ##############################################################################
@@ -234,8 +238,8 @@ class MainWindow(QOpenGLWindow):
                 pos = event.position()
                 diffx = int(pos.x() - self.origX)
                 diffy = int(pos.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = pos.x()
                 self.origY = pos.y()
                 self.update()
@@ -257,13 +261,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
         def keyPressEvent(self, event):
@@ -275,11 +278,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key.Key_L:
-                self.transformLight ^= True
             self.update()
 
 
@@ -301,7 +302,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
@@ -16,6 +16,7 @@ except ImportError:
 
 import sys
 
+import numpy as np
 from OpenGL.GL import *
 from pyngl import *
 
@@ -24,11 +25,14 @@ class MainWindow(QOpenGLWindow):
     def __init__(self, parent=None):
         super(QOpenGLWindow, self).__init__(parent)
         self.mouseGlobalTX = Mat4()
+        # rotateX/Y only write the rotation terms so these can be reused
+        self.rotX = Mat4()
+        self.rotY = Mat4()
         self.width = int(1024)
         self.height = int(720)
         self.setTitle("SimpleIndexedVAO Python")
-        self.spinXFace = int(0)
-        self.spinYFace = int(0)
+        self.spinXFace = 0.0
+        self.spinYFace = 0.0
         self.rotate = False
         self.translate = False
         self.origX = int(0)
@@ -40,6 +44,7 @@ class MainWindow(QOpenGLWindow):
         self.modelPos = Vec3()
         self.view = Mat4()
         self.project = Mat4()
+        self.VP = Mat4()
         self.vao = None
 
     def initializeGL(self):
@@ -60,36 +65,39 @@ class MainWindow(QOpenGLWindow):
         self.project = perspective(
             45.0, float(self.width) / float(self.height), 0.05, 350.0
         )
+        self.VP = self.project * self.view
         self.buildVAO()
 
     def buildVAO(self):
-        vertAndColour = VectorVec3(
+        # position then colour for each vertex
+        vertAndColour = np.array(
             [
-                Vec3(-0.26286500, 0.0000000, 0.42532500),
-                Vec3(1.0, 0.0, 0.0),
-                Vec3(0.26286500, 0.0000000, 0.42532500),
-                Vec3(1.0, 0.55, 0.0),
-                Vec3(-0.26286500, 0.0000000, -0.42532500),
-                Vec3(1.0, 0.0, 1.0),
-                Vec3(0.26286500, 0.0000000, -0.42532500),
-                Vec3(0.0, 1.0, 0.0),
-                Vec3(0.0000000, 0.42532500, 0.26286500),
-                Vec3(0.0, 0.0, 1.0),
-                Vec3(0.0000000, 0.42532500, -0.26286500),
-                Vec3(0.29, 0.51, 0.0),
-                Vec3(0.0000000, -0.42532500, 0.26286500),
-                Vec3(0.5, 0.0, 0.5),
-                Vec3(0.0000000, -0.42532500, -0.26286500),
-                Vec3(1.0, 1.0, 1.0),
-                Vec3(0.42532500, 0.26286500, 0.0000000),
-                Vec3(0.0, 1.0, 1.0),
-                Vec3(-0.42532500, 0.26286500, 0.0000000),
-                Vec3(0.0, 0.0, 0.0),
-                Vec3(0.42532500, -0.26286500, 0.0000000),
-                Vec3(0.12, 0.56, 1.0),
-                Vec3(-0.42532500, -0.26286500, 0.0000000),
-                Vec3(0.86, 0.08, 0.24),
-            ]
+                [-0.26286500, 0.0000000, 0.42532500],
+                [1.0, 0.0, 0.0],
+                [0.26286500, 0.0000000, 0.42532500],
+                [1.0, 0.55, 0.0],
+                [-0.26286500, 0.0000000, -0.42532500],
+                [1.0, 0.0, 1.0],
+                [0.26286500, 0.0000000, -0.42532500],
+                [0.0, 1.0, 0.0],
+                [0.0000000, 0.42532500, 0.26286500],
+                [0.0, 0.0, 1.0],
+                [0.0000000, 0.42532500, -0.26286500],
+                [0.29, 0.51, 0.0],
+                [0.0000000, -0.42532500, 0.26286500],
+                [0.5, 0.0, 0.5],
+                [0.0000000, -0.42532500, -0.26286500],
+                [1.0, 1.0, 1.0],
+                [0.42532500, 0.26286500, 0.0000000],
+                [0.0, 1.0, 1.0],
+                [-0.42532500, 0.26286500, 0.0000000],
+                [0.0, 0.0, 0.0],
+                [0.42532500, -0.26286500, 0.0000000],
+                [0.12, 0.56, 1.0],
+                [-0.42532500, -0.26286500, 0.0000000],
+                [0.86, 0.08, 0.24],
+            ],
+            dtype=np.float32,
         )
 
         indices = VectorUint(
@@ -159,8 +167,11 @@ class MainWindow(QOpenGLWindow):
 
         self.vao = VAOFactory.createVAO(simpleIndexVAO, GL_TRIANGLES)
         self.vao.bind()
-        self.vao.setData(
-            len(vertAndColour) * Vec3.sizeof(), vertAndColour, len(indices), indices
+        # let the vao create its vertex and index buffers, the vertex buffer is
+        # left bound so fill it from the array directly
+        self.vao.setData(0, VectorVec3(), len(indices), indices)
+        glBufferData(
+            GL_ARRAY_BUFFER, vertAndColour.nbytes, vertAndColour, GL_STATIC_DRAW
         )
         self.vao.setVertexAttributePointer(0, 3, GL_FLOAT, 24, 0)
         self.vao.setVertexAttributePointer(1, 3, GL_FLOAT, 24, 3)
@@ -169,20 +180,16 @@ class MainWindow(QOpenGLWindow):
         self.vao.unbind()
 
     def loadMatricesToShader(self):
-        ShaderLib.use("Colour")
-
-        ShaderLib.setUniform("MVP", self.project * self.view * self.mouseGlobalTX)
+        # the only shader is bound once in initializeGL
+        ShaderLib.setUniform("MVP", self.VP * self.mouseGlobalTX)
 
     def paintGL(self):
         try:
-            self.makeCurrent()
             glViewport(0, 0, self.width, self.height)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            rotX = Mat4()
-            rotY = Mat4()
-            rotX.rotateX(self.spinXFace)
-            rotY.rotateY(self.spinYFace)
-            self.mouseGlobalTX = rotY * rotX
+            self.rotX.rotateX(self.spinXFace)
+            self.rotY.rotateY(self.spinYFace)
+            self.mouseGlobalTX = self.rotY * self.rotX
             self.mouseGlobalTX.m_30 = self.modelPos.m_x
             self.mouseGlobalTX.m_31 = self.modelPos.m_y
             self.mouseGlobalTX.m_32 = self.modelPos.m_z
@@ -197,6 +204,7 @@ class MainWindow(QOpenGLWindow):
         self.width = int(w * self.devicePixelRatio())
         self.height = int(h * self.devicePixelRatio())
         self.project = perspective(45.0, float(w) / h, 0.05, 350.0)
+        self.VP = self.project * self.view
 
     if PyQtVersion == 5:
 
@@ -209,11 +217,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key_L:
-                self.transformLight ^= True
             self.update()
 
         def mouseMoveEvent(self, event):
@@ -221,8 +227,8 @@ class MainWindow(QOpenGLWindow):
 
                 diffx = int(event.x() - self.origX)
                 diffy = int(event.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = event.x()
                 self.origY = event.y()
                 self.update()
@@ -255,13 +261,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
     ##############################################################################
@@ -286,8 +291,8 @@ class MainWindow(QOpenGLWindow):
                 pos = event.position()
                 diffx = int(pos.x() - self.origX)
                 diffy = int(pos.y() - self.origY)
-                self.spinXFace += int(0.5 * diffy)
-                self.spinYFace += int(0.5 * diffx)
+                self.spinXFace += 0.5 * diffy
+                self.spinYFace += 0.5 * diffx
                 self.origX = pos.x()
                 self.origY = pos.y()
                 self.update()
@@ -309,13 +314,12 @@ class MainWindow(QOpenGLWindow):
                 self.translate = False
 
         def wheelEvent(self, event):
-            numPixels = event.pixelDelta()
-
-            if numPixels.x() > 0:
-                self.modelPos.m_z += self.ZOOM
-
-            elif numPixels.x() < 0:
-                self.modelPos.m_z -= self.ZOOM
+            angle = event.angleDelta()
+            delta = angle.y() or angle.x()
+            # nothing to zoom so don't trigger a repaint
+            if delta == 0:
+                return
+            self.modelPos.m_z += self.ZOOM * delta / 120.0
             self.update()
 
         def keyPressEvent(self, event):
@@ -327,11 +331,9 @@ class MainWindow(QOpenGLWindow):
             elif key == Qt.Key.Key_S:
                 glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             elif key == Qt.Key.Key_Space:
-                self.spinXFace = 0
-                self.spinYFace = 0
+                self.spinXFace = 0.0
+                self.spinYFace = 0.0
                 self.modelPos.set(Vec3.zero())
-            elif key == Qt.Key.Key_L:
-                self.transformLight ^= True
             self.update()
 
 
@@ -353,7 +355,6 @@ if __name__ == "__main__":
     QSurfaceFormat.setDefaultFormat(format)
 
     window = MainWindow()
-    window.setFormat(format)
     window.resize(1024, 720)
     window.show()
     if PyQtVersion == 5:
@@ -0,0 +1,9 @@
+import numpy as np
+
+
+def triangleNormals(p1, p2, p3):
+    # batch version of calcNormal(p1, p2, p3) for (N,3) arrays of triangle
+    # corners, uses the same winding normalize((p3 - p1) x (p2 - p1))
+    normals = np.cross(p3 - p1, p2 - p1)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    return normals